@@ -12,6 +12,9 @@ setup(
         "mediapipe>=0.8.9",
         "numpy>=1.19.0",
     ],
+    extras_require={
+        "speedups": ["numba>=0.56"],
+    },
     python_requires=">=3.7",
     entry_points={
         "console_scripts": [
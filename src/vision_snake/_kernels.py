@@ -0,0 +1,55 @@
+"""
+Numeric kernels for the snake game's per-update checks.
+
+Each kernel is written as a plain loop that Numba compiles when it is
+installed (pip install vision_snake[speedups]), with a vectorized NumPy
+version used otherwise.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def hits_body_loop(body, count, head_x, head_y, radius_sq):
+    """
+    Check whether the head lies within a radius of any of the first `count` segments.
+    
+    Plain loop version, compiled with Numba when it is available.
+    
+    Args:
+        body (numpy.ndarray): (N, 2) int32 array of segment positions
+        count (int): Number of leading segments to test
+        head_x (int): X coordinate of the snake's head
+        head_y (int): Y coordinate of the snake's head
+        radius_sq (int): Squared collision radius
+        
+    Returns:
+        bool: True if any tested segment is closer than the radius
+    """
+    for i in range(count):
+        dx = body[i, 0] - head_x
+        dy = body[i, 1] - head_y
+        if dx * dx + dy * dy < radius_sq:
+            return True
+    return False
+
+
+def hits_body_vectorized(body, count, head_x, head_y, radius_sq):
+    """NumPy version of hits_body_loop, used when Numba is not installed"""
+    # Broadcast against the x and y columns separately: no head array to build
+    # and no (N, 2) temporary to reduce over
+    dx = body[:count, 0] - head_x
+    dy = body[:count, 1] - head_y
+    return bool((dx * dx + dy * dy < radius_sq).any())
+
+
+if njit is not None:
+    hits_body = njit(cache=True)(hits_body_loop)
+    # Compile (or load from the on-disk cache) now instead of stalling the first frame
+    hits_body(np.zeros((1, 2), dtype=np.int32), 1, 0, 0, 1)
+else:
+    hits_body = hits_body_vectorized
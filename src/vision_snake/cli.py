@@ -4,7 +4,6 @@ Command-line interface for Vision Snake Game
 """
 
 import argparse
-from vision_snake.game import VisionSnakeGame
 
 def main():
     """
@@ -14,15 +13,21 @@ def main():
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
     parser.add_argument('--camera', type=int, default=None, 
                         help='Specify camera index to use (0 for built-in, 1 for external, etc.)')
+    parser.add_argument('--model-complexity', type=int, choices=[0, 1], default=0,
+                        help='MediaPipe hand landmark model: 0 for lite (faster), 1 for full (more accurate)')
     args = parser.parse_args()
     
+    # Imported after parsing so --help and argument errors don't pay for OpenCV/MediaPipe
+    from vision_snake.game import VisionSnakeGame
+    
     try:
         print("Starting Vision Snake Game...")
         print("Use your index finger to control the snake.")
         print("Show an open palm for 2 seconds to restart after game over.")
         print("Press 'q' or ESC to quit.")
         
-        game = VisionSnakeGame(camera_index=args.camera)
+        game = VisionSnakeGame(camera_index=args.camera, debug=args.debug,
+                               model_complexity=args.model_complexity)
         game.run()
     except Exception as e:
         print(f"Error running Vision Snake Game: {e}")
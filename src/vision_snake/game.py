@@ -1,17 +1,52 @@
 import cv2
 import numpy as np
+import os
+import threading
 import time
-import mediapipe as mp
 from vision_snake.hand_tracker import HandTracker
-from vision_snake.snake_game import SnakeGame
+from vision_snake.pipeline import LatestSlot
 from vision_snake.state_manager import StateManager, MenuState, PlayingState
 
+# cv2.pollKey (OpenCV 4.5.2+) handles GUI events without waitKey's minimum delay
+_poll_key = getattr(cv2, "pollKey", lambda: cv2.waitKey(1))
+
 class VisionSnakeGame:
     """
     Main game class that ties together hand tracking and snake game logic.
     """
-    def __init__(self, camera_index=None):
-        """Initialize the Vision Snake Game components"""
+    # Upper bound on stale frames skipped per read, so a fast camera can't starve us
+    MAX_DRAIN = 2
+    # A grab that returns quicker than this was served from the driver's buffer
+    STALE_GRAB_SECONDS = 0.005
+    # Seconds between dropped-frame reports (and inference resolution adjustments)
+    DROP_REPORT_INTERVAL = 5.0
+    # Frames are handed to hand tracking at most this often; faster cameras are skipped
+    TARGET_FPS = 30
+    # Width of the downscaled copy fed to hand tracking; drawing stays at full resolution
+    INFERENCE_WIDTH = 640
+    # Lowest width the inference copy is degraded to under sustained load
+    MIN_INFERENCE_WIDTH = 320
+    # Share of frames overwritten before inference got to them that lowers / restores
+    # the inference resolution
+    DEGRADE_DROP_RATE = 0.5
+    RECOVER_DROP_RATE = 0.1
+
+    def __init__(self, camera_index=None, debug=False, model_complexity=0):
+        """
+        Initialize the Vision Snake Game components
+
+        Args:
+            camera_index (int): Camera to open, or None to auto-detect
+            debug (bool): Print pipeline statistics such as dropped frames
+            model_complexity (int): MediaPipe landmark model, 0 (lite) or 1 (full)
+        """
+        self.debug = debug
+        
+        # Use OpenCV's SIMD code paths and leave half the cores to MediaPipe's own
+        # inference thread pool, so the two don't oversubscribe the CPU
+        cv2.setUseOptimized(True)
+        cv2.setNumThreads(max(1, (os.cpu_count() or 2) // 2))
+        
         # Initialize webcam based on camera_index parameter
         if camera_index is not None:
             # Use the specified camera index
@@ -39,6 +74,10 @@ class VisionSnakeGame:
                         break
                     cap.release()
         
+        # Keep the driver-side queue as short as possible so we never process old frames
+        # (not every backend honours this, hence the drain in _grab_latest_frame)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        
         # Get webcam dimensions
         success, frame = self.cap.read()
         if not success:
@@ -46,8 +85,9 @@ class VisionSnakeGame:
         
         self.frame_height, self.frame_width, _ = frame.shape
         
-        # Initialize hand tracker
-        self.hand_tracker = HandTracker(detection_confidence=0.7, tracking_confidence=0.5)
+        # Initialize hand tracker; the palm detector only reruns when tracking confidence drops below 0.5
+        self.hand_tracker = HandTracker(detection_confidence=0.7, tracking_confidence=0.5,
+                                        model_complexity=model_complexity)
         
         # Initialize state manager with webcam dimensions
         self.state_manager = StateManager(game_width=self.frame_width, game_height=self.frame_height)
@@ -59,37 +99,254 @@ class VisionSnakeGame:
         # Start with the menu state
         self.state_manager.change_state("menu")
         
-        # FPS calculation variables
-        self.prev_time = 0
-        self.curr_time = 0
+        # Frame schedule and dropped frame statistics (only touched by the capture thread)
+        self.target_period = 1.0 / self.TARGET_FPS
+        self.dropped_frames = 0
+        self._dropped_since_report = 0
+        self._published_since_report = 0
+        self._overwritten_since_report = 0
+        self._last_drop_report = time.monotonic()
+        
+        # Downscaled inference input, reused between frames
+        self.inference_width = self.INFERENCE_WIDTH
+        self._inference_buf = None
+        
+        # Pipeline threads: capture -> capture_slot -> inference -> results_slot -> render
+        # -> display_slot -> main thread, which only displays frames and handles keys
+        self.capture_slot = LatestSlot()
+        self.results_slot = LatestSlot()
+        self.display_slot = LatestSlot()
+        # Guards the state manager, which is updated by the render thread and keyed by the main thread
+        self._state_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._threads = []
+        # First exception raised by a pipeline thread, re-raised by run()
+        self._worker_error = None
+    
+    def _grab_latest_frame(self):
+        """
+        Grab the newest available frame, skipping frames queued in the capture buffer.
+        
+        Frames are grabbed without decoding; call self.cap.retrieve() to decode the last one.
+        
+        Returns:
+            bool: True if a frame was grabbed
+        """
+        grabs = 0
+        while True:
+            start = time.monotonic()
+            if not self.cap.grab():
+                return False
+            grabs += 1
+            # A grab that had to wait on the camera is fresh, so stop draining
+            if grabs > self.MAX_DRAIN or time.monotonic() - start > self.STALE_GRAB_SECONDS:
+                break
+        
+        self._record_frames(stale=grabs - 1)
+        return True
+    
+    def _record_frames(self, published=0, stale=0, overwritten=0):
+        """
+        Accumulate frame statistics from the capture thread.
+        
+        Every DROP_REPORT_INTERVAL seconds the inference resolution is adapted to the
+        share of frames that hand tracking could not keep up with, and in debug mode
+        the dropped frame counts are printed.
+        
+        Args:
+            published (int): Frames handed to the inference thread
+            stale (int): Frames skipped because they sat in the capture buffer
+            overwritten (int): Published frames replaced before inference took them
+        """
+        self.dropped_frames += stale + overwritten
+        self._dropped_since_report += stale + overwritten
+        self._published_since_report += published
+        self._overwritten_since_report += overwritten
+        
+        now = time.monotonic()
+        if now - self._last_drop_report < self.DROP_REPORT_INTERVAL:
+            return
+        
+        if self._published_since_report:
+            self._adapt_inference_width(self._overwritten_since_report / self._published_since_report)
+        
+        if self.debug and self._dropped_since_report:
+            print(f"Dropped {self._dropped_since_report} frames "
+                  f"in the last {now - self._last_drop_report:.0f}s "
+                  f"({self.dropped_frames} total)")
+        
+        self._dropped_since_report = 0
+        self._published_since_report = 0
+        self._overwritten_since_report = 0
+        self._last_drop_report = now
+    
+    def _adapt_inference_width(self, drop_rate):
+        """
+        Lower the inference resolution while hand tracking falls behind, and restore it once it keeps up.
+        
+        Args:
+            drop_rate (float): Share of published frames that inference never processed
+        """
+        if drop_rate > self.DEGRADE_DROP_RATE:
+            width = max(self.MIN_INFERENCE_WIDTH, int(self.inference_width * 0.75))
+        elif drop_rate < self.RECOVER_DROP_RATE:
+            width = min(self.INFERENCE_WIDTH, int(self.inference_width / 0.75))
+        else:
+            return
+        
+        if width != self.inference_width:
+            if self.debug:
+                print(f"Inference width {self.inference_width} -> {width} "
+                      f"({drop_rate:.0%} of frames dropped)")
+            self.inference_width = width
+    
+    def _capture_loop(self):
+        """Capture thread: publish the newest mirrored webcam frame on the target schedule"""
+        next_due = time.monotonic()
+        try:
+            while not self._stop_event.is_set():
+                if not self._grab_latest_frame():
+                    break
+                
+                # Skip (without decoding) frames that arrive well ahead of schedule, so
+                # cameras faster than TARGET_FPS don't flood inference
+                now = time.monotonic()
+                if now < next_due - 0.2 * self.target_period:
+                    continue
+                # Stay on schedule, but never try to catch up on frames we were late for
+                next_due = max(next_due, now - self.target_period) + self.target_period
+                
+                success, frame = self.cap.retrieve()
+                if not success:
+                    break
+                
+                # Flip the frame horizontally for a more intuitive mirror view
+                frame = cv2.flip(frame, 1)
+                
+                # Inference is still busy with an older frame; it was never processed
+                overwritten = self.capture_slot.put(frame)
+                self._record_frames(published=1, overwritten=int(overwritten))
+        except BaseException as e:
+            self._record_worker_error(e)
+        finally:
+            # Always wake the inference thread, even if capture failed unexpectedly
+            self.capture_slot.close()
+            # Only this thread uses the camera, so release it here once no grab can be in
+            # progress; stop_pipeline stops waiting on a camera that stalls
+            self.cap.release()
+    
+    def _inference_loop(self):
+        """Inference thread: run hand tracking on the newest captured frame"""
+        try:
+            while not self._stop_event.is_set():
+                frame = self.capture_slot.take()
+                if frame is None:
+                    break
+                
+                # MediaPipe returns normalized landmarks, so tracking on a smaller copy
+                # still maps back onto the full-resolution frame used for drawing
+                _, results = self.hand_tracker.find_hands(self._inference_input(frame))
+                
+                # Materialize the landmarks here so the render thread only touches arrays
+                landmarks = self.hand_tracker.landmark_array(results)
+                self.results_slot.put((frame, results, landmarks))
+        except BaseException as e:
+            self._record_worker_error(e)
+        finally:
+            # Always wake the main thread so run() can exit instead of hanging
+            self.results_slot.close()
+    
+    def _inference_input(self, frame):
+        """
+        Downscale a frame to the inference width, keeping its aspect ratio.
+        
+        Args:
+            frame (numpy.ndarray): Full-resolution BGR frame
+            
+        Returns:
+            numpy.ndarray: The downscaled frame, or the input frame if it is already small enough
+        """
+        height, width = frame.shape[:2]
+        if width <= self.inference_width:
+            return frame
+        
+        size = (self.inference_width, round(height * self.inference_width / width))
+        if self._inference_buf is None or self._inference_buf.shape[:2] != (size[1], size[0]):
+            self._inference_buf = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        
+        cv2.resize(frame, size, dst=self._inference_buf, interpolation=cv2.INTER_LINEAR)
+        return self._inference_buf
+    
+    def _render_loop(self):
+        """Render thread: update the game and draw each tracked frame"""
+        try:
+            while not self._stop_event.is_set():
+                frame = self.process_frame()
+                if frame is None:
+                    break
+                
+                self.display_slot.put(frame)
+        except BaseException as e:
+            self._record_worker_error(e)
+        finally:
+            # Always wake the main thread so run() can exit instead of hanging
+            self.display_slot.close()
+    
+    def _record_worker_error(self, error):
+        """
+        Keep the first exception raised by a pipeline thread so run() can re-raise it.
+        
+        Args:
+            error (BaseException): The exception that ended the thread
+        """
+        if self._worker_error is None:
+            self._worker_error = error
+    
+    def start_pipeline(self):
+        """Start the capture, inference and render threads"""
+        self._stop_event.clear()
+        self._worker_error = None
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="capture", daemon=True),
+            threading.Thread(target=self._inference_loop, name="inference", daemon=True),
+            threading.Thread(target=self._render_loop, name="render", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+    
+    def stop_pipeline(self):
+        """Signal the pipeline threads to stop and wait for them to finish"""
+        self._stop_event.set()
+        self.capture_slot.close()
+        self.results_slot.close()
+        self.display_slot.close()
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+        self._threads = []
     
     def process_frame(self):
-        """Process a single frame from the webcam"""
-        # Read frame from webcam
-        success, frame = self.cap.read()
-        if not success:
-            return None
+        """
+        Update and render the game with the newest hand tracking results.
         
-        # Flip the frame horizontally for a more intuitive mirror view
-        frame = cv2.flip(frame, 1)
+        Called by the render thread; requires the capture and inference threads
+        to be running (see start_pipeline).
         
-        # Process the frame with hand tracker
-        frame, results = self.hand_tracker.find_hands(frame)
+        Returns:
+            numpy.ndarray: The rendered frame, or None if the webcam stopped delivering frames
+        """
+        # Wait for the inference thread to finish a frame
+        item = self.results_slot.take()
+        if item is None:
+            return None
+        frame, results, hand_landmarks = item
         
         # Get index finger position
         finger_pos, frame = self.hand_tracker.get_index_finger_position(frame, results, draw=True)
         
-        # Update the current state
-        hand_landmarks = results.multi_hand_landmarks[0] if results.multi_hand_landmarks else None
-        self.state_manager.update(hand_landmarks, finger_pos)
-        
-        # Render the current state
-        frame = self.state_manager.render(frame)
-        
-        # Calculate FPS
-        self.curr_time = time.time()
-        fps = 1 / (self.curr_time - self.prev_time) if self.prev_time > 0 else 0
-        self.prev_time = self.curr_time
+        # Update and render the current state
+        with self._state_lock:
+            self.state_manager.update(hand_landmarks, finger_pos)
+            frame = self.state_manager.render(frame)
         
         return frame
     
@@ -103,23 +360,36 @@ class VisionSnakeGame:
         print("Press 'p' to pause, 'm' to return to menu when paused.")
         print("Press 'q' or ESC to quit.")
         
-        while True:
-            frame = self.process_frame()
-            if frame is None:
-                print("Failed to read frame from webcam.")
-                break
-            
-            # Display the frame
-            cv2.imshow("Vision Snake Game", frame)
-            
-            # Check for key presses
-            key = cv2.waitKey(1)
-            if not self.state_manager.handle_key(key):
-                break
+        # Capture, hand tracking and rendering run in the background; this thread
+        # only displays finished frames and handles key presses
+        self.start_pipeline()
+        try:
+            while True:
+                # Wait briefly for a new frame, but keep polling keys either way
+                frame = self.display_slot.take(timeout=self.target_period)
+                if frame is not None:
+                    # Display the frame
+                    cv2.imshow("Vision Snake Game", frame)
+                elif self.display_slot.closed:
+                    # A failed worker thread also closes the slots; its error is raised below
+                    if self._worker_error is None:
+                        print("Failed to read frame from webcam.")
+                    break
+                
+                # Check for key presses
+                key = _poll_key()
+                with self._state_lock:
+                    keep_running = self.state_manager.handle_key(key)
+                if not keep_running:
+                    break
+        finally:
+            # Clean up (the capture thread releases the camera itself)
+            self.stop_pipeline()
+            cv2.destroyAllWindows()
         
-        # Clean up
-        self.cap.release()
-        cv2.destroyAllWindows()
+        # Report a pipeline thread's failure to the caller, as if it had happened here
+        if self._worker_error is not None:
+            raise self._worker_error
     
     def __del__(self):
         """Ensure resources are released when the object is destroyed"""
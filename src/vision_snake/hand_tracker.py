@@ -1,5 +1,4 @@
 import cv2
-import mediapipe as mp
 import numpy as np
 
 class HandTracker:
@@ -8,19 +7,32 @@ class HandTracker:
     Tracks the position of the index finger tip in real-time.
     """
     
-    def __init__(self, detection_confidence=0.7, tracking_confidence=0.7):
+    def __init__(self, detection_confidence=0.7, tracking_confidence=0.5, model_complexity=0):
         """
         Initialize the hand tracker with MediaPipe Hands.
         
         Args:
             detection_confidence (float): Confidence threshold for hand detection
-            tracking_confidence (float): Confidence threshold for hand tracking
+            tracking_confidence (float): Hand presence threshold for tracking. While the
+                landmark model stays above it, the next frame's hand region is derived
+                from the current landmarks and palm detection is skipped
+            model_complexity (int): Landmark model to use, 0 for the lite model
+                (roughly half the inference cost, plenty for fingertip control)
+                or 1 for the full model
         """
+        if model_complexity not in (0, 1):
+            raise ValueError(f"model_complexity must be 0 or 1, got {model_complexity}")
+        
+        # Imported lazily: MediaPipe takes hundreds of milliseconds to load, which
+        # shouldn't delay argument parsing or camera errors
+        import mediapipe as mp
+        
         # Initialize MediaPipe Hands
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
+            static_image_mode=False,  # Track from previous landmarks instead of detecting every frame
             max_num_hands=1,  # Track only one hand for simplicity
+            model_complexity=model_complexity,
             min_detection_confidence=detection_confidence,
             min_tracking_confidence=tracking_confidence
         )
@@ -28,6 +40,9 @@ class HandTracker:
         
         # Store the previous index finger position to handle tracking loss
         self.prev_index_finger_pos = None
+        
+        # Reusable RGB buffer for MediaPipe input, allocated on the first frame
+        self._rgb_buf = None
     
     def find_hands(self, frame):
         """
@@ -40,11 +55,15 @@ class HandTracker:
             frame (numpy.ndarray): The processed frame with hand landmarks drawn
             results: MediaPipe hand detection results
         """
-        # Convert BGR to RGB for MediaPipe
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # Convert BGR to RGB for MediaPipe into a persistent buffer instead of a new array
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+        self._rgb_buf.flags.writeable = True
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
         
-        # Process the frame with MediaPipe Hands
-        results = self.hands.process(frame_rgb)
+        # Marking the input read-only lets MediaPipe skip its defensive copy
+        self._rgb_buf.flags.writeable = False
+        results = self.hands.process(self._rgb_buf)
         
         return frame, results
     
@@ -94,3 +113,20 @@ class HandTracker:
             index_finger_pos = self.prev_index_finger_pos
         
         return index_finger_pos, frame
+    
+    def landmark_array(self, results):
+        """
+        Convert the tracked hand's landmarks into an array.
+        
+        Args:
+            results: MediaPipe hand detection results
+            
+        Returns:
+            numpy.ndarray: (21, 3) float32 array of normalized (x, y, z) landmark
+                coordinates, or None if no hand was detected
+        """
+        if not results.multi_hand_landmarks:
+            return None
+        
+        landmarks = results.multi_hand_landmarks[0].landmark
+        return np.array([(p.x, p.y, p.z) for p in landmarks], dtype=np.float32)
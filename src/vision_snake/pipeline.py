@@ -0,0 +1,71 @@
+"""
+Threading helpers for the Vision Snake frame pipeline.
+
+Capture, hand tracking and rendering run concurrently and hand frames to each
+other through single-slot mailboxes. A producer always overwrites the pending
+item, so a slow consumer only ever sees the newest frame instead of working
+through a backlog.
+"""
+
+import threading
+
+
+class LatestSlot:
+    """
+    A thread-safe mailbox that holds at most one item.
+    """
+
+    def __init__(self):
+        """Initialize an empty slot"""
+        self._lock = threading.Lock()
+        self._item = None
+        self._ready = threading.Event()
+        self._closed = False
+
+    def put(self, item):
+        """
+        Store an item, replacing any item that has not been taken yet.
+
+        Args:
+            item: The item to store (must not be None)
+
+        Returns:
+            bool: True if an unconsumed item was overwritten (i.e. dropped)
+        """
+        with self._lock:
+            dropped = self._item is not None
+            self._item = item
+            self._ready.set()
+        return dropped
+
+    def take(self, timeout=None):
+        """
+        Wait for an item and remove it from the slot.
+
+        Args:
+            timeout (float): Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            The stored item, or None if the wait timed out or the slot was closed
+        """
+        if not self._ready.wait(timeout):
+            return None
+
+        with self._lock:
+            item = self._item
+            self._item = None
+            # Once closed, keep the event set so no consumer blocks again
+            if not self._closed:
+                self._ready.clear()
+        return item
+
+    def close(self):
+        """Wake up any waiting consumer; later take() calls return immediately"""
+        with self._lock:
+            self._closed = True
+            self._ready.set()
+
+    @property
+    def closed(self):
+        """bool: Whether close() has been called"""
+        return self._closed
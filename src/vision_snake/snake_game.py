@@ -1,7 +1,15 @@
 import cv2
+import math
 import numpy as np
-import random
 import time
+from vision_snake._kernels import hits_body
+
+# OpenCV drawing constants, bound once so the draw calls skip the module attribute lookups
+_FONT_SIMPLEX = cv2.FONT_HERSHEY_SIMPLEX
+_FONT_DUPLEX = cv2.FONT_HERSHEY_DUPLEX
+_LINE_AA = cv2.LINE_AA
+_FILLED = cv2.FILLED
+
 
 class SnakeGame:
     """
@@ -13,6 +21,9 @@ class SnakeGame:
     - Drawing the game elements on the screen
     """
     
+    # Random food positions drawn per spawn, so one clear of the body can be picked
+    FOOD_CANDIDATES = 32
+    
     def __init__(self, game_width, game_height):
         """
         Initialize the Snake game.
@@ -25,7 +36,13 @@ class SnakeGame:
         self.height = game_height
         
         # Initialize snake properties
-        self.snake_body = []
+        # The body is a ring buffer of segment positions, tail first. Every position is
+        # stored twice (at i and i + capacity), so the live segments are always one
+        # contiguous slice: appending and trimming are O(1) and nothing is ever copied
+        self._capacity = 32
+        self._body = np.empty((2 * self._capacity, 2), dtype=np.int32)
+        self._body_start = 0  # Index of the tail segment
+        self._body_len = 0
         self.max_length = 10  # Initial snake length
         self.score = 0
         self.game_over = False
@@ -34,6 +51,13 @@ class SnakeGame:
         self.food_pos = None
         self.food_radius = 15
         self.food_pulse_counter = 0  # For pulsating effect
+        self._rng = np.random.default_rng()  # PCG64, created once and reused for every spawn
+        
+        # Squared distance thresholds, so collision checks never need a sqrt
+        self._food_reach = self.food_radius + 10  # +10 for snake head radius
+        self._food_r2 = self._food_reach * self._food_reach
+        self._collision_r2 = 10 * 10  # Reduced collision threshold (10 px) for better gameplay
+        
         self.generate_food()
         
         # Colors based on score
@@ -45,23 +69,110 @@ class SnakeGame:
         ]
         
         # Game state
-        self.last_update_time = time.time()
+        self.last_update_time = time.monotonic()
         self.update_interval = 0.05  # seconds between position updates
+        
+        # Pre-rendered game over screen, rebuilt only when its inputs change
+        self._gameover_layer = None
+        self._gameover_inv_alpha = None
+        self._gameover_roi = None
+        self._gameover_key = None
+        
+        # Pre-rendered food sprites keyed by pulse radius: (sprite, mask)
+        self._food_sprites = {}
+        
+        # Stroke widths along the body only depend on its length, which rarely changes
+        self._stroke_runs_len = None
+        self._stroke_runs_cache = None
+        
+        # Text metrics keyed by (text, font, scale, thickness); they never change
+        self._text_size_cache = {}
+        
+        # Screen positions that only depend on the game area size
+        self._compute_layout()
+    
+    def _compute_layout(self):
+        """Precompute the draw positions derived from the game area size"""
+        self._score_pos = (10, 30)
+        self._score_shadow_pos = (11, 31)
+        self._border_pt1 = (10, 10)
+        self._border_pt2 = (self.width - 10, self.height - 10)
+        self._center_x = self.width / 2
+        self._center_y = int(self.height / 2)
+        
+        # The restart instruction is the only game over text drawn every frame
+        self._instruction = "Show open palm to restart"
+        inst_size = self._text_size(self._instruction, _FONT_SIMPLEX, 1, 2)
+        inst_x = int(self._center_x - inst_size[0]/2)
+        self._instruction_pos = (inst_x, self._center_y + 110)
+        self._instruction_shadow_pos = (inst_x + 1, self._center_y + 110 + 1)
+    
+    @property
+    def snake_body(self):
+        """numpy.ndarray: (N, 2) contiguous view of the snake's segment positions, tail first"""
+        return self._body[self._body_start:self._body_start + self._body_len]
+    
+    @snake_body.setter
+    def snake_body(self, positions):
+        positions = np.asarray(positions, dtype=np.int32).reshape(-1, 2)
+        self._body_len = 0
+        self._ensure_capacity(len(positions))
+        self._store_ordered(positions)
+    
+    def _store_ordered(self, positions):
+        """Write positions (tail first) to the start of both halves of the ring buffer"""
+        count = len(positions)
+        self._body[:count] = positions
+        self._body[self._capacity:self._capacity + count] = positions
+        self._body_start = 0
+        self._body_len = count
+    
+    def _ensure_capacity(self, size):
+        """Grow the ring buffer so that it can hold at least `size` segments"""
+        if size > self._capacity:
+            positions = self.snake_body.copy()
+            while self._capacity < size:
+                self._capacity *= 2
+            self._body = np.empty((2 * self._capacity, 2), dtype=np.int32)
+            self._store_ordered(positions)
+    
+    def _append_segment(self, position):
+        """Add a new head segment to the ring buffer"""
+        self._ensure_capacity(self._body_len + 1)
+        index = (self._body_start + self._body_len) % self._capacity
+        self._body[index] = position
+        self._body[index + self._capacity] = position
+        self._body_len += 1
     
     def reset(self):
         """Reset the game to initial state"""
-        self.snake_body = []
+        self._body_start = 0
+        self._body_len = 0
         self.max_length = 10
         self.score = 0
         self.game_over = False
         self.generate_food()
     
     def generate_food(self):
-        """Generate food at a random position on the screen"""
+        """Generate food at a random position on the screen, away from the snake's body"""
         margin = 50  # Keep food away from the edges
-        x = random.randint(margin, self.width - margin)
-        y = random.randint(margin, self.height - margin)
-        self.food_pos = (x, y)
+        candidates = self._rng.integers((margin, margin),
+                                        (self.width - margin + 1, self.height - margin + 1),
+                                        size=(self.FOOD_CANDIDATES, 2))
+        
+        index = 0
+        if self._body_len > 0:
+            # Squared distance from every candidate to its nearest segment, in one broadcast
+            diff = candidates[:, None, :] - self.snake_body[None, :, :]
+            nearest = (diff * diff).sum(axis=2).min(axis=1)
+            
+            # Take the first candidate that can't be eaten on the spot; if the body
+            # covers all of them, the one farthest from it
+            clear = np.flatnonzero(nearest >= self._food_r2)
+            index = clear[0] if len(clear) else nearest.argmax()
+        
+        x, y = candidates[index]
+        self.food_pos = (int(x), int(y))
     
     def update(self, head_pos):
         """
@@ -76,52 +187,53 @@ class SnakeGame:
         if self.game_over or head_pos is None:
             return False
         
-        current_time = time.time()
-        force_update = False
-        
-        # For testing purposes, we'll force an update if the snake body is empty
-        # or if we're in a test environment (no time-based throttling)
-        if len(self.snake_body) == 0 or (current_time - self.last_update_time >= self.update_interval):
-            force_update = True
-            self.last_update_time = current_time
-        
-        # Update position if it's time or forced
-        if force_update:
-            # First, check if the snake has eaten the food
-            # This needs to happen BEFORE collision detection to prevent false positives
-            food_eaten = False
-            if self.food_pos and head_pos:
-                distance = np.sqrt((head_pos[0] - self.food_pos[0])**2 + 
-                                 (head_pos[1] - self.food_pos[1])**2)
+        current_time = time.monotonic()
+        
+        # Between position updates there is nothing to do, so skip the food and
+        # collision checks entirely (an empty snake always takes its first segment)
+        if self._body_len > 0 and current_time - self.last_update_time < self.update_interval:
+            return True
+        self.last_update_time = current_time
+        
+        # First, check if the snake has eaten the food
+        # This needs to happen BEFORE collision detection to prevent false positives
+        food_eaten = False
+        if self.food_pos and head_pos:
+            # Compare squared distances to avoid a sqrt, after a bounding box test that
+            # rules out the usual case (head nowhere near the food) without multiplying
+            dx = head_pos[0] - self.food_pos[0]
+            dy = head_pos[1] - self.food_pos[1]
+            reach = self._food_reach
+            
+            if -reach < dx < reach and -reach < dy < reach and dx * dx + dy * dy < self._food_r2:
+                self.score += 1
+                self.max_length += 5  # Increase snake length
+                food_eaten = True
                 
-                if distance < self.food_radius + 10:  # +10 for snake head radius
-                    self.score += 1
-                    self.max_length += 5  # Increase snake length
-                    self.generate_food()
-                    food_eaten = True
-                    
-                    # Speed up the game slightly as score increases
-                    self.update_interval = max(0.03, 0.05 - self.score * 0.001)
-            
-            # Add new head position to the snake body
-            self.snake_body.append(head_pos)
-            
-            # Limit the snake length
-            if len(self.snake_body) > self.max_length:
-                self.snake_body = self.snake_body[-self.max_length:]
-            
-            # Check for collision with itself ONLY if not eating food
-            # This prevents false collision detection when collecting food
-            if not food_eaten and len(self.snake_body) >= 6:  # Only check if snake is long enough
-                head = self.snake_body[-1]
-                # Check against all body parts except the last 5 (near the head)
-                for i in range(len(self.snake_body) - 6):
-                    body_part = self.snake_body[i]
-                    distance = np.sqrt((head[0] - body_part[0])**2 + 
-                                     (head[1] - body_part[1])**2)
-                    if distance < 10:  # Reduced collision threshold for better gameplay
-                        self.game_over = True
-                        return False
+                # Speed up the game slightly as score increases
+                self.update_interval = max(0.03, 0.05 - self.score * 0.001)
+        
+        # Add new head position to the snake body
+        self._append_segment(head_pos)
+        
+        # Limit the snake length by advancing the tail past the oldest segments
+        if self._body_len > self.max_length:
+            self._body_start = (self._body_start + self._body_len - self.max_length) % self._capacity
+            self._body_len = self.max_length
+        
+        # Respawn eaten food only now, so the new head (sitting right where the food was)
+        # is part of the body that the new position has to keep clear of
+        if food_eaten:
+            self.generate_food()
+        
+        # Check for collision with itself ONLY if not eating food
+        # This prevents false collision detection when collecting food
+        if not food_eaten and self._body_len >= 6:  # Only check if snake is long enough
+            # Check against all body parts except the last 5 (near the head)
+            if hits_body(self.snake_body, self._body_len - 6, head_pos[0], head_pos[1],
+                          self._collision_r2):
+                self.game_over = True
+                return False
         
         return not self.game_over  # Return False if game is over, True otherwise
     
@@ -136,113 +248,257 @@ class SnakeGame:
             numpy.ndarray: The frame with game elements drawn
         """
         # Draw snake body with danger highlighting
-        if len(self.snake_body) > 0:
+        if self._body_len > 0:
+            body_points = self.snake_body
+            # Plain (x, y) lists are accepted as points by every OpenCV version
+            snake_body = body_points.tolist()
+            
             # Determine snake color based on score
             color_index = min(self.score // 5, len(self.snake_colors) - 1)
             snake_color = self.snake_colors[color_index]
             
             # First, draw danger zones around the snake body (things to avoid)
-            for i in range(len(self.snake_body) - 5):  # Skip the last 5 segments (near head)
-                position = self.snake_body[i]
-                # Draw a semi-transparent danger zone
+            if len(snake_body) > 5:
+                # Draw all circles onto one overlay and blend it once (semi-transparent)
                 danger_overlay = frame.copy()
-                cv2.circle(danger_overlay, position, 15, (0, 0, 200), 2)  # Red danger circle
+                for position in snake_body[:-5]:  # Skip the last 5 segments (near head)
+                    cv2.circle(danger_overlay, position, 15, (0, 0, 200), 2)  # Red danger circle
                 cv2.addWeighted(danger_overlay, 0.3, frame, 0.7, 0, frame)
             
-            # Draw each segment of the snake with better visibility
-            for i, position in enumerate(self.snake_body):
-                # Make the segments larger toward the head
-                radius = 5 + (i / len(self.snake_body)) * 5
-                if i == len(self.snake_body) - 1:  # Head
-                    # Draw the head with a highlight
-                    cv2.circle(frame, position, 12, (255, 255, 255), 2)  # White outline
-                    cv2.circle(frame, position, 10, snake_color, cv2.FILLED)
-                else:  # Body
-                    cv2.circle(frame, position, int(radius), snake_color, cv2.FILLED)
-                    # Add a darker border to make it stand out
-                    cv2.circle(frame, position, int(radius), (snake_color[0]//2, snake_color[1]//2, snake_color[2]//2), 1)
-            
-            # Connect snake segments with lines for a smoother appearance
-            for i in range(1, len(self.snake_body)):
-                if i > 0:
-                    cv2.line(frame, self.snake_body[i-1], self.snake_body[i], 
-                             snake_color, thickness=max(5, int(5 + (i / len(self.snake_body)) * 5)))
+            # Draw the body as one stroke that widens toward the head, instead of a
+            # circle pair per segment. Stroke i joins segments i and i+1 and is as wide
+            # as segment i's circle used to be; widths only take a handful of values,
+            # so each run of equal width is a single polylines call
+            if len(snake_body) > 1:
+                runs = self._stroke_runs(len(snake_body))
+                
+                # Add a darker border to make it stand out: a slightly wider stroke underneath
+                border_color = (snake_color[0]//2, snake_color[1]//2, snake_color[2]//2)
+                for start, end, radius in runs:
+                    points = body_points[start:end + 1].reshape(-1, 1, 2)
+                    cv2.polylines(frame, [points], False, border_color, thickness=2 * radius + 2)
+                for start, end, radius in runs:
+                    points = body_points[start:end + 1].reshape(-1, 1, 2)
+                    cv2.polylines(frame, [points], False, snake_color, thickness=2 * radius)
+            
+            # Draw the head with a highlight
+            head = snake_body[-1]
+            cv2.circle(frame, head, 12, (255, 255, 255), 2)  # White outline
+            cv2.circle(frame, head, 10, snake_color, _FILLED)
         
         # Draw food with attention-grabbing effects (things to collect)
         if self.food_pos:
             # Create pulsating effect for food
             self.food_pulse_counter = (self.food_pulse_counter + 1) % 30
-            pulse_size = self.food_radius + 3 * np.sin(self.food_pulse_counter * 0.2)
+            pulse_size = self.food_radius + 3 * math.sin(self.food_pulse_counter * 0.2)
             
-            # Draw attention-grabbing circles around food
-            cv2.circle(frame, self.food_pos, int(pulse_size + 10), (0, 140, 255), 2)  # Outer orange circle
-            cv2.circle(frame, self.food_pos, int(pulse_size + 5), (0, 215, 255), 2)   # Middle yellow circle
+            # Stamp the pre-rendered rings and food body instead of rasterizing the
+            # circles again; the pulse only takes a few distinct radii
+            sprite, mask = self._get_food_sprite(int(pulse_size))
+            half = sprite.shape[0] // 2
+            x0 = self.food_pos[0] - half
+            y0 = self.food_pos[1] - half
             
-            # Draw the food itself (bright red)
-            cv2.circle(frame, self.food_pos, int(pulse_size), (0, 0, 255), cv2.FILLED)
-            
-            # Add a white border and highlight to make it more visible
-            cv2.circle(frame, self.food_pos, int(pulse_size), (255, 255, 255), 2)
+            # Clip the sprite to the frame (food normally spawns well inside it)
+            left, top = max(x0, 0), max(y0, 0)
+            right = min(x0 + sprite.shape[1], frame.shape[1])
+            bottom = min(y0 + sprite.shape[0], frame.shape[0])
+            if left < right and top < bottom:
+                cv2.copyTo(sprite[top - y0:bottom - y0, left - x0:right - x0],
+                           mask[top - y0:bottom - y0, left - x0:right - x0],
+                           frame[top:bottom, left:right])
             
             # Add "COLLECT" text near the food
             cv2.putText(frame, "COLLECT", 
                        (self.food_pos[0] - 40, self.food_pos[1] - int(pulse_size) - 10), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2, cv2.LINE_AA)
+                       _FONT_SIMPLEX, 0.6, (0, 255, 255), 2, _LINE_AA)
         
         # Draw score with better visibility
         score_text = f"Score: {self.score}"
         # Draw text with black outline for better visibility
-        cv2.putText(frame, score_text, (11, 31), cv2.FONT_HERSHEY_SIMPLEX, 
-                    1, (0, 0, 0), 4, cv2.LINE_AA)  # Thicker black outline
-        cv2.putText(frame, score_text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 
-                    1, (255, 255, 255), 2, cv2.LINE_AA)  # White text
+        cv2.putText(frame, score_text, self._score_shadow_pos, _FONT_SIMPLEX, 
+                    1, (0, 0, 0), 4, _LINE_AA)  # Thicker black outline
+        cv2.putText(frame, score_text, self._score_pos, _FONT_SIMPLEX, 
+                    1, (255, 255, 255), 2, _LINE_AA)  # White text
         
         # Draw game over message if game is over
         if self.game_over:
-            # Create a semi-transparent overlay for the game over message
-            overlay = frame.copy()
-            cv2.rectangle(overlay, (0, 0), (self.width, self.height), (0, 0, 0), -1)
-            cv2.addWeighted(overlay, 0.5, frame, 0.5, 0, frame)  # 50% transparency
+            layer, inv_alpha, (x, y, w, h) = self._get_gameover_layer()
+            
+            # Darken the frame (same as blending with a black overlay at 50%)
+            cv2.convertScaleAbs(frame, frame, alpha=0.5)
             
             # Draw a red border around the screen
-            cv2.rectangle(frame, (10, 10), (self.width-10, self.height-10), (0, 0, 255), 5)
-            
-            # Draw "GAME OVER!" with a glowing effect
-            game_over_text = "GAME OVER!"
-            text_size = cv2.getTextSize(game_over_text, cv2.FONT_HERSHEY_DUPLEX, 2, 2)[0]
-            text_x = int(self.width/2 - text_size[0]/2)
-            text_y = int(self.height/2)
-            
-            # Draw outer glow effect
-            for offset in range(5, 0, -1):
-                cv2.putText(frame, game_over_text, 
-                           (text_x-offset, text_y), 
-                           cv2.FONT_HERSHEY_DUPLEX, 2, (0, 0, 50+offset*40), 2, cv2.LINE_AA)
-            
-            # Draw main text
-            cv2.putText(frame, game_over_text, (text_x, text_y), 
-                       cv2.FONT_HERSHEY_DUPLEX, 2, (0, 0, 255), 2, cv2.LINE_AA)
-            
-            # Draw score with enhanced visibility
-            score_text = f"Final Score: {self.score}"
-            score_size = cv2.getTextSize(score_text, cv2.FONT_HERSHEY_SIMPLEX, 1.2, 2)[0]
-            score_x = int(self.width/2 - score_size[0]/2)
-            
-            cv2.putText(frame, score_text, (score_x+1, text_y+50+1), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 4, cv2.LINE_AA)  # Shadow
-            cv2.putText(frame, score_text, (score_x, text_y+50), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 255), 2, cv2.LINE_AA)
-            
-            # Draw instruction with animated effect (pulsating)
-            instruction = "Show open palm to restart"
-            pulse = int(5 * np.sin(time.time() * 5) + 5)  # Pulsating effect
-            inst_size = cv2.getTextSize(instruction, cv2.FONT_HERSHEY_SIMPLEX, 1, 2)[0]
-            inst_x = int(self.width/2 - inst_size[0]/2)
+            cv2.rectangle(frame, self._border_pt1, self._border_pt2, (0, 0, 255), 5)
+            
+            # Blend the pre-rendered text in, weighting by its anti-aliased coverage
+            # so the glyph edges fade into the frame instead of leaving dark fringes
+            if w and h:
+                region = frame[y:y+h, x:x+w]
+                cv2.multiply(region, inv_alpha, region, scale=1/255)
+                cv2.add(region, layer, region)
+            
+            # Draw instruction with animated effect (pulsating); the only per-frame text
+            pulse = int(5 * math.sin(time.time() * 5) + 5)  # Pulsating effect
             
             # Draw with yellow highlight
-            cv2.putText(frame, instruction, (inst_x+1, text_y+110+1), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 0), 3, cv2.LINE_AA)  # Shadow
-            cv2.putText(frame, instruction, (inst_x, text_y+110), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255-pulse*10, 255), 2, cv2.LINE_AA)
+            cv2.putText(frame, self._instruction, self._instruction_shadow_pos, 
+                       _FONT_SIMPLEX, 1, (0, 0, 0), 3, _LINE_AA)  # Shadow
+            cv2.putText(frame, self._instruction, self._instruction_pos, 
+                       _FONT_SIMPLEX, 1, (0, 255-pulse*10, 255), 2, _LINE_AA)
         
         return frame
+    
+    def _stroke_runs(self, n):
+        """
+        Return the equal-width stroke runs for an n-segment body, computing them once per length.
+        
+        Args:
+            n (int): Number of body segments
+            
+        Returns:
+            list: (start, end, radius) tuples as yielded by _runs
+        """
+        if self._stroke_runs_len != n:
+            radii = (5 + np.arange(n - 1) / n * 5).astype(np.int32)
+            self._stroke_runs_cache = list(self._runs(radii))
+            self._stroke_runs_len = n
+        return self._stroke_runs_cache
+    
+    @staticmethod
+    def _runs(values):
+        """
+        Split a 1-D array into runs of equal consecutive values.
+        
+        Args:
+            values (numpy.ndarray): The values to split
+            
+        Yields:
+            tuple: (start, end, value) where end is the index one past the run's
+                last element, so a run of strokes spans points start..end
+        """
+        run_starts = np.flatnonzero(np.diff(values)) + 1
+        for start, end in zip(np.r_[0, run_starts], np.r_[run_starts, len(values)]):
+            yield int(start), int(end), int(values[start])
+    
+    def _text_size(self, text, font, scale, thickness):
+        """
+        Return the (width, height) of rendered text, measuring it only once.
+        
+        Args:
+            text (str): The text to measure
+            font (int): OpenCV font face
+            scale (float): Font scale
+            thickness (int): Stroke thickness
+            
+        Returns:
+            tuple: (width, height) as returned by cv2.getTextSize
+        """
+        key = (text, font, scale, thickness)
+        size = self._text_size_cache.get(key)
+        if size is None:
+            size = cv2.getTextSize(text, font, scale, thickness)[0]
+            self._text_size_cache[key] = size
+        return size
+    
+    def _get_food_sprite(self, radius):
+        """
+        Return the food drawn around the center of a small canvas, rendering it if needed.
+        
+        Args:
+            radius (int): Radius of the food body; the rings are 5 and 10 px further out
+            
+        Returns:
+            tuple: (sprite, mask) where sprite is a square image centered on the food
+                and mask is a uint8 array marking the pixels that were drawn
+        """
+        cached = self._food_sprites.get(radius)
+        if cached is not None:
+            return cached
+        
+        # The outer ring is 2 px thick, so it reaches one pixel beyond radius + 10
+        half = radius + 12
+        sprite = np.zeros((2 * half + 1, 2 * half + 1, 3), dtype=np.uint8)
+        mask = np.zeros(sprite.shape[:2], dtype=np.uint8)
+        center = (half, half)
+        
+        for canvas, colors in ((sprite, ((0, 140, 255), (0, 215, 255), (0, 0, 255), (255, 255, 255))),
+                               (mask, (255, 255, 255, 255))):
+            # Attention-grabbing outer orange and middle yellow circles
+            cv2.circle(canvas, center, radius + 10, colors[0], 2)
+            cv2.circle(canvas, center, radius + 5, colors[1], 2)
+            
+            # The food itself (bright red) with a white border to make it more visible
+            cv2.circle(canvas, center, radius, colors[2], _FILLED)
+            cv2.circle(canvas, center, radius, colors[3], 2)
+        
+        self._food_sprites[radius] = (sprite, mask)
+        return sprite, mask
+    
+    def _get_gameover_layer(self):
+        """
+        Return the static text of the game over screen, rendering it if needed.
+        
+        The glowing title and final score only change with the score, so they
+        are drawn once onto a black layer and reused. Since the text is drawn
+        over black, the layer already holds each color premultiplied by its
+        anti-aliased coverage, and (frame * inv_alpha / 255 + layer) blends it
+        in exactly as drawing it straight onto the frame would.
+        
+        Returns:
+            tuple: (layer, inv_alpha, roi) where roi is the (x, y, w, h) box
+                around the text, layer is the hxwx3 text image in that box and
+                inv_alpha is the matching hxwx3 uint8 array of 255 - coverage
+        """
+        key = self.score
+        if self._gameover_key == key:
+            return self._gameover_layer, self._gameover_inv_alpha, self._gameover_roi
+        
+        layer = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        
+        # Draw "GAME OVER!" with a glowing effect
+        game_over_text = "GAME OVER!"
+        text_size = self._text_size(game_over_text, _FONT_DUPLEX, 2, 2)
+        text_x = int(self._center_x - text_size[0]/2)
+        text_y = self._center_y
+        
+        # Draw outer glow effect
+        for offset in range(5, 0, -1):
+            cv2.putText(layer, game_over_text, 
+                       (text_x-offset, text_y), 
+                       _FONT_DUPLEX, 2, (0, 0, 50+offset*40), 2, _LINE_AA)
+        
+        # Draw main text
+        cv2.putText(layer, game_over_text, (text_x, text_y), 
+                   _FONT_DUPLEX, 2, (0, 0, 255), 2, _LINE_AA)
+        
+        # Draw score with enhanced visibility
+        score_text = f"Final Score: {self.score}"
+        score_size = self._text_size(score_text, _FONT_SIMPLEX, 1.2, 2)
+        score_x = int(self._center_x - score_size[0]/2)
+        
+        cv2.putText(layer, score_text, (score_x+1, text_y+50+1), 
+                   _FONT_SIMPLEX, 1.2, (0, 0, 0), 4, _LINE_AA)  # Shadow
+        cv2.putText(layer, score_text, (score_x, text_y+50), 
+                   _FONT_SIMPLEX, 1.2, (255, 255, 255), 2, _LINE_AA)
+        
+        # The score shadow is pure black, so build the coverage from drawn shapes rather than colors
+        mask = np.zeros((self.height, self.width), dtype=np.uint8)
+        for offset in range(5, -1, -1):
+            cv2.putText(mask, game_over_text, (text_x-offset, text_y), 
+                       _FONT_DUPLEX, 2, 255, 2, _LINE_AA)
+        cv2.putText(mask, score_text, (score_x+1, text_y+50+1), 
+                   _FONT_SIMPLEX, 1.2, 255, 4, _LINE_AA)
+        cv2.putText(mask, score_text, (score_x, text_y+50), 
+                   _FONT_SIMPLEX, 1.2, 255, 2, _LINE_AA)
+        
+        # Only the box around the text needs blending each frame
+        x, y, w, h = cv2.boundingRect(mask)
+        layer = layer[y:y+h, x:x+w].copy()
+        inv_alpha = cv2.cvtColor(255 - mask[y:y+h, x:x+w], cv2.COLOR_GRAY2BGR)
+        
+        self._gameover_layer = layer
+        self._gameover_inv_alpha = inv_alpha
+        self._gameover_roi = (x, y, w, h)
+        self._gameover_key = key
+        return layer, inv_alpha, (x, y, w, h)
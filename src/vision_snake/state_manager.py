@@ -8,10 +8,21 @@ rendering and input handling, making state transitions cleaner and more maintain
 
 from abc import ABC, abstractmethod
 import cv2
+import math
 import numpy as np
 import time
 from vision_snake.snake_game import SnakeGame
 
+# MediaPipe hand landmark indices: thumb, index, middle, ring and pinky tips
+FINGER_TIP_INDICES = np.array([4, 8, 12, 16, 20])
+# MediaPipe hand landmark index of the wrist
+WRIST_INDEX = 0
+
+# Font and line type constants for the render paths
+_FONT_SIMPLEX = cv2.FONT_HERSHEY_SIMPLEX
+_FONT_DUPLEX = cv2.FONT_HERSHEY_DUPLEX
+_LINE_AA = cv2.LINE_AA
+
 
 class GameState(ABC):
     """Abstract base class for all game states."""
@@ -35,7 +46,7 @@ class GameState(ABC):
         Update the state based on input.
         
         Args:
-            hand_landmarks: MediaPipe hand landmarks
+            hand_landmarks: (21, 3) array of normalized hand landmarks, or None
             finger_pos: Position of the index finger
             
         Returns:
@@ -80,9 +91,37 @@ class MenuState(GameState):
         self.selection_cooldown = 0
         self.pulse_value = 0
         
+        # Options are stacked around the vertical center; each one reacts to a finger
+        # within 20 px above or below its baseline
+        self._option_height = 60
+        self._option_start_y = game_height // 2 - len(self.options) * self._option_height // 2
+        self._option_hit_top = self._option_start_y - 20
+        
+        # The menu text never changes, so lay it out once instead of every frame
+        self._title = "VISION SNAKE"
+        title_size = cv2.getTextSize(self._title, _FONT_DUPLEX, 2.0, 2)[0]
+        self._title_pos = (int(game_width/2 - title_size[0]/2), int(game_height/4))
+        
+        # Per option: text position and the corners of its selection box
+        box_padding = 20
+        self._option_layout = []
+        for i, option in enumerate(self.options):
+            option_size = cv2.getTextSize(option, _FONT_SIMPLEX, 1.0, 2)[0]
+            option_x = int(game_width/2 - option_size[0]/2)
+            option_y = self._option_start_y + i * self._option_height
+            self._option_layout.append((
+                (option_x, option_y),
+                (option_x - box_padding, option_y - option_size[1] - box_padding),
+                (option_x + option_size[0] + box_padding, option_y + box_padding),
+            ))
+        
+        self._instruction = "Point at an option and hold to select"
+        inst_size = cv2.getTextSize(self._instruction, _FONT_SIMPLEX, 0.7, 1)[0]
+        self._instruction_pos = (int(game_width/2 - inst_size[0]/2), int(game_height * 0.85))
+        
     def update(self, hand_landmarks, finger_pos):
         # Update pulse effect for visual feedback
-        self.pulse_value = (self.pulse_value + 0.1) % (2 * np.pi)
+        self.pulse_value = (self.pulse_value + 0.1) % (2 * math.pi)
         
         # Handle selection cooldown
         if self.selection_cooldown > 0:
@@ -92,21 +131,18 @@ class MenuState(GameState):
         if finger_pos is None:
             return
             
-        # Check if finger is pointing at an option
+        # Check if finger is pointing at an option: the options are evenly spaced,
+        # so the row under the finger can be computed directly
         x, y = finger_pos
-        option_height = 60
-        option_start_y = self.height // 2 - len(self.options) * option_height // 2
-        
-        for i, option in enumerate(self.options):
-            option_y = option_start_y + i * option_height
-            if option_y - 20 <= y <= option_y + 20:
-                if i != self.selected_option:
-                    self.selected_option = i
-                    self.selection_cooldown = 10  # Prevent rapid selection changes
-                break
+        offset = y - self._option_hit_top
+        i = int(offset // self._option_height)
+        if 0 <= i < len(self.options) and offset - i * self._option_height <= 40:
+            if i != self.selected_option:
+                self.selected_option = i
+                self.selection_cooldown = 10  # Prevent rapid selection changes
         
         # Check if finger is held on an option (selection gesture)
-        if hand_landmarks and finger_pos:
+        if hand_landmarks is not None and finger_pos:
             # Simple selection: hold finger in place for a moment
             # In a real implementation, you might want a more sophisticated gesture
             if self.selection_cooldown == 0:
@@ -121,72 +157,47 @@ class MenuState(GameState):
                     return False
     
     def render(self, frame):
-        # Create a semi-transparent overlay for the menu background
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (self.width, self.height), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)  # 70% opacity
+        # Darken the background (same as blending with a black overlay at 70% opacity)
+        cv2.convertScaleAbs(frame, frame, alpha=0.3)
         
         # Draw game title with glow effect
-        title = "VISION SNAKE"
-        title_scale = 2.0
-        title_thickness = 2
-        title_font = cv2.FONT_HERSHEY_DUPLEX
-        
-        title_size = cv2.getTextSize(title, title_font, title_scale, title_thickness)[0]
-        title_x = int(self.width/2 - title_size[0]/2)
-        title_y = int(self.height/4)
+        title_font = _FONT_DUPLEX
+        title_x, title_y = self._title_pos
         
         # Draw glow effect
-        glow_color = (0, int(100 + 50 * np.sin(self.pulse_value)), 255)
         for offset in range(5, 0, -1):
-            cv2.putText(frame, title, 
+            cv2.putText(frame, self._title, 
                        (title_x-offset, title_y), 
-                       title_font, title_scale, (0, 0, 50+offset*40), title_thickness, cv2.LINE_AA)
+                       title_font, 2.0, (0, 0, 50+offset*40), 2, _LINE_AA)
         
         # Draw main title
-        cv2.putText(frame, title, (title_x, title_y), 
-                   title_font, title_scale, (0, 200, 255), title_thickness, cv2.LINE_AA)
+        cv2.putText(frame, self._title, self._title_pos, 
+                   title_font, 2.0, (0, 200, 255), 2, _LINE_AA)
         
         # Draw menu options
-        option_font = cv2.FONT_HERSHEY_SIMPLEX
-        option_scale = 1.0
-        option_thickness = 2
-        option_height = 60
-        option_start_y = self.height // 2 - len(self.options) * option_height // 2
+        option_font = _FONT_SIMPLEX
         
-        for i, option in enumerate(self.options):
-            option_size = cv2.getTextSize(option, option_font, option_scale, option_thickness)[0]
-            option_x = int(self.width/2 - option_size[0]/2)
-            option_y = option_start_y + i * option_height
-            
+        for i, (option, (option_pos, box_start, box_end)) in enumerate(
+                zip(self.options, self._option_layout)):
             # Highlight selected option
             if i == self.selected_option:
                 # Pulsating highlight effect
-                highlight_intensity = int(155 + 100 * np.sin(self.pulse_value))
+                highlight_intensity = int(155 + 100 * math.sin(self.pulse_value))
                 
                 # Draw selection box
-                box_padding = 20
-                box_start = (option_x - box_padding, option_y - option_size[1] - box_padding)
-                box_end = (option_x + option_size[0] + box_padding, option_y + box_padding)
-                
                 cv2.rectangle(frame, box_start, box_end, (0, highlight_intensity, 255), 2)
                 
                 # Draw the text with brighter color
-                cv2.putText(frame, option, (option_x, option_y), 
-                           option_font, option_scale, (0, 255, 255), option_thickness, cv2.LINE_AA)
+                cv2.putText(frame, option, option_pos, 
+                           option_font, 1.0, (0, 255, 255), 2, _LINE_AA)
             else:
                 # Draw normal option
-                cv2.putText(frame, option, (option_x, option_y), 
-                           option_font, option_scale, (200, 200, 200), option_thickness, cv2.LINE_AA)
+                cv2.putText(frame, option, option_pos, 
+                           option_font, 1.0, (200, 200, 200), 2, _LINE_AA)
         
         # Draw instruction at the bottom
-        instruction = "Point at an option and hold to select"
-        inst_size = cv2.getTextSize(instruction, option_font, 0.7, 1)[0]
-        inst_x = int(self.width/2 - inst_size[0]/2)
-        inst_y = int(self.height * 0.85)
-        
-        cv2.putText(frame, instruction, (inst_x, inst_y), 
-                   option_font, 0.7, (150, 150, 150), 1, cv2.LINE_AA)
+        cv2.putText(frame, self._instruction, self._instruction_pos, 
+                   option_font, 0.7, (150, 150, 150), 1, _LINE_AA)
         
         return frame
     
@@ -225,17 +236,33 @@ class PlayingState(GameState):
         self.prev_time = 0
         self.curr_time = 0
         self.paused = False
+        
+        # FPS label layout and text, reformatted only when the value changes
+        self._fps_pos = (game_width - 120, 30)
+        self._fps_value = None
+        self._fps_text = ""
+        
+        # Pause screen text positions, centered horizontally below the middle of the screen
+        pause_size = cv2.getTextSize("PAUSED", _FONT_DUPLEX, 2, 2)[0]
+        resume_size = cv2.getTextSize("Press 'P' to resume", _FONT_SIMPLEX, 1, 1)[0]
+        menu_size = cv2.getTextSize("Press 'M' for menu", _FONT_SIMPLEX, 1, 1)[0]
+        pause_y = int(game_height/2)
+        self._pause_pos = (int(game_width/2 - pause_size[0]/2), pause_y)
+        self._resume_pos = (int(game_width/2 - resume_size[0]/2), pause_y + 50)
+        self._menu_pos = (int(game_width/2 - menu_size[0]/2), pause_y + 90)
     
     def update(self, hand_landmarks, finger_pos):
         if self.paused:
             return True
             
-        # Check for reset gesture (open palm) when game is over
-        if self.game.game_over and hand_landmarks:
-            self._check_reset_gesture(hand_landmarks)
+        # Check for reset gesture (open palm) when game is over; that is all there
+        # is to do on the game over screen, so the game itself isn't updated
+        if self.game.game_over:
+            if hand_landmarks is not None:
+                self._check_reset_gesture(hand_landmarks)
         
         # Update the game state
-        if finger_pos:
+        elif finger_pos:
             self.game.update(finger_pos)
             
         # If game is over, consider transitioning to game over state
@@ -262,38 +289,26 @@ class PlayingState(GameState):
             # Update prev_time for next frame's calculation
             self.prev_time = self.curr_time
         
-        cv2.putText(frame, f"FPS: {int(fps)}", (self.width - 120, 30), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+        if int(fps) != self._fps_value:
+            self._fps_value = int(fps)
+            self._fps_text = f"FPS: {self._fps_value}"
+        
+        cv2.putText(frame, self._fps_text, self._fps_pos, 
+                   _FONT_SIMPLEX, 0.7, (255, 255, 255), 2)
         
         # Draw pause indicator if paused
         if self.paused:
-            overlay = frame.copy()
-            cv2.rectangle(overlay, (0, 0), (self.width, self.height), (0, 0, 0), -1)
-            cv2.addWeighted(overlay, 0.5, frame, 0.5, 0, frame)
+            # Darken the frame in place (same as blending with a black overlay at 50%)
+            cv2.convertScaleAbs(frame, frame, alpha=0.5)
             
-            pause_text = "PAUSED"
-            text_size = cv2.getTextSize(pause_text, cv2.FONT_HERSHEY_DUPLEX, 2, 2)[0]
-            text_x = int(self.width/2 - text_size[0]/2)
-            text_y = int(self.height/2)
+            cv2.putText(frame, "PAUSED", self._pause_pos, 
+                       _FONT_DUPLEX, 2, (255, 255, 255), 2, _LINE_AA)
             
-            cv2.putText(frame, pause_text, (text_x, text_y), 
-                       cv2.FONT_HERSHEY_DUPLEX, 2, (255, 255, 255), 2, cv2.LINE_AA)
+            cv2.putText(frame, "Press 'P' to resume", self._resume_pos, 
+                       _FONT_SIMPLEX, 1, (200, 200, 200), 1, _LINE_AA)
             
-            resume_text = "Press 'P' to resume"
-            resume_size = cv2.getTextSize(resume_text, cv2.FONT_HERSHEY_SIMPLEX, 1, 1)[0]
-            resume_x = int(self.width/2 - resume_size[0]/2)
-            resume_y = text_y + 50
-            
-            cv2.putText(frame, resume_text, (resume_x, resume_y), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1, (200, 200, 200), 1, cv2.LINE_AA)
-            
-            menu_text = "Press 'M' for menu"
-            menu_size = cv2.getTextSize(menu_text, cv2.FONT_HERSHEY_SIMPLEX, 1, 1)[0]
-            menu_x = int(self.width/2 - menu_size[0]/2)
-            menu_y = resume_y + 40
-            
-            cv2.putText(frame, menu_text, (menu_x, menu_y), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1, (200, 200, 200), 1, cv2.LINE_AA)
+            cv2.putText(frame, "Press 'M' for menu", self._menu_pos, 
+                       _FONT_SIMPLEX, 1, (200, 200, 200), 1, _LINE_AA)
         
         return frame
     
@@ -311,18 +326,10 @@ class PlayingState(GameState):
     
     def _check_reset_gesture(self, hand_landmarks):
         """Check for open palm reset gesture"""
-        # Get all finger landmarks
-        landmarks = hand_landmarks.landmark
-        
-        # Check if all fingers are extended (simple open palm detection)
-        # MediaPipe hand landmarks: thumb tip (4), index tip (8), middle tip (12), 
-        # ring tip (16), pinky tip (20), wrist (0)
-        finger_tips = [4, 8, 12, 16, 20]
-        wrist_y = landmarks[0].y
-        
-        # Count extended fingers (fingers whose tips are higher than the wrist)
-        extended_fingers = sum(1 for tip_idx in finger_tips 
-                             if landmarks[tip_idx].y < wrist_y)
+        # Check if all fingers are extended (simple open palm detection):
+        # count fingers whose tips are higher than the wrist in one comparison
+        extended_fingers = np.count_nonzero(
+            hand_landmarks[FINGER_TIP_INDICES, 1] < hand_landmarks[WRIST_INDEX, 1])
         
         # If all fingers are extended (open palm)
         if extended_fingers >= 4:
@@ -381,7 +388,7 @@ class StateManager:
         Update the current state.
         
         Args:
-            hand_landmarks: MediaPipe hand landmarks
+            hand_landmarks: (21, 3) array of normalized hand landmarks, or None
             finger_pos: Position of the index finger
             
         Returns:
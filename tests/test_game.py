@@ -0,0 +1,181 @@
+"""
+Tests for the game module.
+
+The webcam and MediaPipe are replaced by stubs, so the pipeline runs without
+any hardware.
+"""
+
+import time
+import unittest
+import numpy as np
+from unittest.mock import patch
+from vision_snake.game import VisionSnakeGame
+
+
+class StubCapture:
+    """Stands in for cv2.VideoCapture, serving the same small frame forever."""
+
+    def __init__(self, grab_delay=0):
+        self.frame = np.zeros((240, 320, 3), dtype=np.uint8)
+        self.grab_delay = grab_delay
+        self.grabs = 0
+        self.grabbing = False
+        self.released = False
+        self.released_while_grabbing = False
+
+    def isOpened(self):
+        return not self.released
+
+    def set(self, prop, value):
+        return True
+
+    def read(self):
+        return True, self.frame.copy()
+
+    def grab(self):
+        self.grabbing = True
+        time.sleep(self.grab_delay)
+        self.grabbing = False
+        self.grabs += 1
+        return not self.released
+
+    def retrieve(self):
+        return True, self.frame.copy()
+
+    def release(self):
+        self.released_while_grabbing |= self.grabbing
+        self.released = True
+
+
+def make_game(cap):
+    """Build a VisionSnakeGame around a stub capture and a mocked hand tracker."""
+    with patch('vision_snake.game.cv2.VideoCapture', return_value=cap), \
+            patch('vision_snake.game.HandTracker'):
+        return VisionSnakeGame()
+
+
+@patch('vision_snake.game.cv2.destroyAllWindows')
+@patch('vision_snake.game.cv2.imshow')
+class TestVisionSnakeGameRun(unittest.TestCase):
+    """Tests for running the threaded pipeline."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.cap = StubCapture()
+        self.game = make_game(self.cap)
+
+    def test_worker_error_is_raised(self, mock_imshow, mock_destroy):
+        """Test that an exception in a pipeline thread is re-raised by run()."""
+        self.game.hand_tracker.find_hands.side_effect = RuntimeError("tracking failed")
+
+        with patch('vision_snake.game._poll_key', return_value=-1):
+            with self.assertRaisesRegex(RuntimeError, "tracking failed"):
+                self.game.run()
+
+        # The pipeline was still shut down
+        self.assertEqual(self.game._threads, [])
+
+    def test_stalled_camera_released_after_grab(self, mock_imshow, mock_destroy):
+        """Test that a camera stuck in grab() is not released underneath it."""
+        # Each grab outlasts the time stop_pipeline waits for the capture thread
+        self.cap.grab_delay = 1.5
+
+        # Quit right away
+        with patch('vision_snake.game._poll_key', return_value=ord('q')):
+            self.game.run()
+
+        # The capture thread releases the camera once its grab returns
+        deadline = time.monotonic() + 5
+        while not self.cap.released and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertTrue(self.cap.released)
+        self.assertFalse(self.cap.released_while_grabbing)
+
+
+class TestVisionSnakeGameCapture(unittest.TestCase):
+    """Tests for frame draining, drop accounting and inference scaling."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.cap = StubCapture()
+        self.game = make_game(self.cap)
+
+    def test_drain_is_capped(self):
+        """Test that at most MAX_DRAIN buffered frames are skipped per read."""
+        # Every grab returns instantly, as if served from a driver buffer that never empties
+        for _ in range(5):
+            self.assertTrue(self.game._grab_latest_frame())
+
+        self.assertEqual(self.cap.grabs, 5 * (VisionSnakeGame.MAX_DRAIN + 1))
+        self.assertEqual(self.game.dropped_frames, 5 * VisionSnakeGame.MAX_DRAIN)
+
+    def test_fresh_frame_stops_drain(self):
+        """Test that a grab that waited on the camera is kept."""
+        self.cap.grab_delay = 4 * VisionSnakeGame.STALE_GRAB_SECONDS
+
+        self.assertTrue(self.game._grab_latest_frame())
+        self.assertEqual(self.cap.grabs, 1)
+        self.assertEqual(self.game.dropped_frames, 0)
+
+    def test_grab_failure(self):
+        """Test that a failed grab is reported."""
+        self.cap.release()
+        self.assertFalse(self.game._grab_latest_frame())
+
+    def test_record_frames(self):
+        """Test that drops are counted and the drop rate is acted on once per interval."""
+        # Within the report interval only the counters move
+        self.game._record_frames(published=10, overwritten=6)
+        self.assertEqual(self.game.dropped_frames, 6)
+        self.assertEqual(self.game.inference_width, VisionSnakeGame.INFERENCE_WIDTH)
+
+        # Once it has passed, the 60% drop rate lowers the width and the interval restarts
+        self.game._last_drop_report -= VisionSnakeGame.DROP_REPORT_INTERVAL
+        self.game._record_frames(stale=1)
+        self.assertEqual(self.game.dropped_frames, 7)
+        self.assertEqual(self.game.inference_width, 480)
+        self.assertEqual(self.game._published_since_report, 0)
+        self.assertEqual(self.game._overwritten_since_report, 0)
+
+    def test_adapt_inference_width(self):
+        """Test the degrade and recover steps, their thresholds and bounds."""
+        steps = [
+            # (drop rate, expected width)
+            (VisionSnakeGame.DEGRADE_DROP_RATE, 640),  # Threshold itself: unchanged
+            (0.6, 480),
+            (0.6, 360),
+            (0.6, 320),  # 270 clamped to MIN_INFERENCE_WIDTH
+            (0.6, 320),
+            (0.3, 320),  # Between the thresholds: unchanged
+            (VisionSnakeGame.RECOVER_DROP_RATE, 320),  # Threshold itself: unchanged
+            (0.05, 426),
+            (0.05, 568),
+            (0.05, 640),  # 757 clamped to INFERENCE_WIDTH
+            (0.05, 640),
+        ]
+        for drop_rate, expected in steps:
+            with self.subTest(drop_rate=drop_rate, expected=expected):
+                self.game._adapt_inference_width(drop_rate)
+                self.assertEqual(self.game.inference_width, expected)
+
+    def test_inference_input(self):
+        """Test that frames are downscaled to the inference width, keeping their aspect ratio."""
+        frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+
+        small = self.game._inference_input(frame)
+        self.assertEqual(small.shape, (360, 640, 3))
+
+        # The buffer is reused while the size stays the same
+        self.assertIs(self.game._inference_input(frame), small)
+
+        # A lower inference width gets a matching buffer
+        self.game.inference_width = 320
+        self.assertEqual(self.game._inference_input(frame).shape, (180, 320, 3))
+
+        # Frames that are already narrow enough are passed through untouched
+        narrow = np.zeros((240, 320, 3), dtype=np.uint8)
+        self.assertIs(self.game._inference_input(narrow), narrow)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+Tests for the pipeline module.
+"""
+
+import threading
+import unittest
+from vision_snake.pipeline import LatestSlot
+
+
+class TestLatestSlot(unittest.TestCase):
+    """Tests for the LatestSlot class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.slot = LatestSlot()
+
+    def test_put_and_take(self):
+        """Test that a stored item is returned once."""
+        self.assertFalse(self.slot.put("frame"))
+        self.assertEqual(self.slot.take(timeout=0), "frame")
+
+        # The slot is empty again
+        self.assertIsNone(self.slot.take(timeout=0))
+
+    def test_put_overwrites_pending_item(self):
+        """Test that only the newest item is kept."""
+        self.slot.put("old")
+
+        # Overwriting an unconsumed item reports a drop
+        self.assertTrue(self.slot.put("new"))
+        self.assertEqual(self.slot.take(timeout=0), "new")
+
+    def test_take_waits_for_producer(self):
+        """Test that take blocks until another thread puts an item."""
+        producer = threading.Timer(0.01, self.slot.put, args=("frame",))
+        producer.start()
+
+        self.assertEqual(self.slot.take(timeout=1), "frame")
+        producer.join()
+
+    def test_close_wakes_consumer(self):
+        """Test that closing the slot releases waiting consumers."""
+        closer = threading.Timer(0.01, self.slot.close)
+        closer.start()
+
+        self.assertIsNone(self.slot.take(timeout=1))
+        closer.join()
+
+        # Further takes return immediately
+        self.assertTrue(self.slot.closed)
+        self.assertIsNone(self.slot.take())
+
+
+if __name__ == '__main__':
+    unittest.main()
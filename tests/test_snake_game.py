@@ -1,6 +1,7 @@
 import unittest
 import numpy as np
 from vision_snake.snake_game import SnakeGame
+from vision_snake._kernels import hits_body_loop, hits_body_vectorized
 
 class TestSnakeGame(unittest.TestCase):
     """Test cases for the SnakeGame class"""
@@ -48,6 +49,31 @@ class TestSnakeGame(unittest.TestCase):
             self.assertGreaterEqual(y, 0)
             self.assertLess(y, self.game_height)
     
+    def test_food_avoids_body(self):
+        """Test that food is not generated on top of the snake"""
+        # Cover the top of the area where food can appear with body segments
+        self.game.snake_body = [(x, y) for y in range(50, 80, 10) for x in range(50, 600, 10)]
+        
+        for _ in range(10):
+            self.game.generate_food()
+            diff = self.game.snake_body - np.array(self.game.food_pos)
+            self.assertGreaterEqual((diff * diff).sum(axis=1).min(), self.game._food_r2)
+    
+    def test_food_respawns_away_from_head(self):
+        """Test that eaten food doesn't respawn where the head can eat it again"""
+        # A small game area makes a respawn near the head likely if it isn't prevented
+        game = SnakeGame(200, 200)
+        head = (100, 100)
+        
+        for _ in range(50):
+            game.food_pos = head
+            game.last_update_time = 0
+            game.update(head)
+            
+            dx = game.food_pos[0] - head[0]
+            dy = game.food_pos[1] - head[1]
+            self.assertGreaterEqual(dx * dx + dy * dy, game._food_r2)
+    
     def test_collision_with_food(self):
         """Test that collision with food increases score and snake length"""
         # Set up a specific food position
@@ -75,9 +101,12 @@ class TestSnakeGame(unittest.TestCase):
         # Make sure the snake is long enough for collision detection
         self.assertGreater(len(self.game.snake_body), 5)
         
-        # Ensure force_update is True by setting last_update_time far in the past
+        # Ensure the update isn't throttled by setting last_update_time far in the past
         self.game.last_update_time = 0
         
+        # Keep food out of the way; eating it would skip the self-collision check
+        self.game.food_pos = None
+        
         # Force a collision by adding a new head position that matches an existing body segment
         result = self.game.update((100, 100))
         
@@ -87,5 +116,110 @@ class TestSnakeGame(unittest.TestCase):
         # The update should return False when game is over
         self.assertFalse(result)
 
+    def test_update_throttled(self):
+        """Test that positions arriving before update_interval are ignored"""
+        self.game.food_pos = None
+        self.assertTrue(self.game.update((100, 100)))
+        
+        # Too soon after the first update: still running, but nothing is added
+        self.assertTrue(self.game.update((120, 100)))
+        self.assertEqual(len(self.game.snake_body), 1)
+
+    def test_body_length_limited(self):
+        """Test that the oldest segments are dropped beyond max_length"""
+        # Keep the food out of the way
+        self.game.food_pos = (600, 400)
+
+        # Move the snake in a straight line, one update per segment
+        for x in range(0, 300, 20):
+            self.game.last_update_time = 0
+            self.assertTrue(self.game.update((x, 50)))
+
+        # Only the newest max_length positions remain, tail first
+        self.assertEqual(len(self.game.snake_body), self.game.max_length)
+        self.assertEqual(tuple(self.game.snake_body[0]), (100, 50))
+        self.assertEqual(tuple(self.game.snake_body[-1]), (280, 50))
+        self.assertFalse(self.game.game_over)
+
+    def test_body_ring_buffer_wraps(self):
+        """Test that the body stays in order after wrapping around the buffer"""
+        self.game.food_pos = None
+        positions = [(x, 100 + (x // 40) * 20) for x in range(0, 400, 4)]
+
+        for position in positions:
+            self.game.last_update_time = 0
+            self.game.update(position)
+
+        # Wrapped many times, yet the newest max_length positions are still contiguous
+        self.assertEqual([tuple(p) for p in self.game.snake_body.tolist()],
+                         positions[-self.game.max_length:])
+
+    def test_gameover_layer_cached(self):
+        """Test that the game over screen is only rendered once per score"""
+        self.game.game_over = True
+        frame = np.zeros((self.game_height, self.game_width, 3), dtype=np.uint8)
+
+        self.game.draw(frame)
+        layer = self.game._gameover_layer
+        self.assertTrue(frame.any())
+
+        # Drawing again reuses the cached layer
+        self.game.draw(frame)
+        self.assertIs(self.game._gameover_layer, layer)
+
+        # A different score invalidates it
+        self.game.score += 1
+        self.game.draw(frame)
+        self.assertIsNot(self.game._gameover_layer, layer)
+
+    def test_gameover_text_blends_into_frame(self):
+        """Test that the anti-aliased game over text edges blend with the frame behind them"""
+        self.game.game_over = True
+        dark = self.game.draw(np.zeros((self.game_height, self.game_width, 3), dtype=np.uint8))
+        light = self.game.draw(np.full((self.game_height, self.game_width, 3), 255, dtype=np.uint8))
+        
+        # Text fully covers some pixels, which look the same on both backgrounds
+        x, y, w, h = self.game._gameover_roi
+        dark, light = dark[y:y+h, x:x+w], light[y:y+h, x:x+w]
+        covered = self.game._gameover_inv_alpha == 0
+        self.assertTrue(covered.any())
+        np.testing.assert_array_equal(dark[covered], light[covered])
+        
+        # Partly covered edge pixels let the background show through
+        edges = (self.game._gameover_inv_alpha > 0) & (self.game._gameover_inv_alpha < 255)
+        self.assertTrue(edges.any())
+        self.assertTrue((light[edges] > dark[edges]).all())
+        
+    def test_food_sprite_clipped_at_frame_edge(self):
+        """Test that food is stamped from a cached sprite, even partly off screen"""
+        frame = np.zeros((self.game_height, self.game_width, 3), dtype=np.uint8)
+        
+        for food_pos in [(320, 240), (5, 5), (self.game_width - 1, self.game_height - 1)]:
+            self.game.food_pos = food_pos
+            self.game.food_pulse_counter = 0
+            self.game.draw(frame)
+            
+            # The food body is bright red
+            x, y = food_pos
+            self.assertEqual(tuple(frame[y, x]), (0, 0, 255))
+        
+        # Every draw used the same pulse radius, so one sprite was rendered
+        self.assertEqual(len(self.game._food_sprites), 1)
+
+    def test_hits_body_implementations_agree(self):
+        """Test that the loop and vectorized collision kernels give the same answer"""
+        body = np.array([(100, 100), (110, 100), (120, 100), (130, 100)], dtype=np.int32)
+        cases = [
+            (4, 100, 100, True),   # Exactly on a segment
+            (4, 135, 104, True),   # Within the radius of the last segment
+            (3, 135, 104, False),  # Last segment excluded by count
+            (4, 100, 120, False),  # Too far from every segment
+            (0, 100, 100, False),  # Nothing to test
+        ]
+        for count, x, y, expected in cases:
+            with self.subTest(count=count, head=(x, y)):
+                self.assertEqual(hits_body_loop(body, count, x, y, 100), expected)
+                self.assertEqual(hits_body_vectorized(body, count, x, y, 100), expected)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,26 +1,52 @@
 """
 Tests for the state manager module.
+
+The test classes are independent and are run in parallel with pytest-xdist
+(pytest -n auto). Keep them side-effect free: fixtures shared through
+setUpClass are read-only or reset in setUp, and patches are started and
+stopped within their own class, so each worker process stays self-contained.
 """
 
 import unittest
 import numpy as np
-import cv2
-from unittest.mock import MagicMock, patch
+from unittest.mock import create_autospec, patch, sentinel
+from vision_snake.snake_game import SnakeGame
 from vision_snake.state_manager import StateManager, GameState, MenuState, PlayingState
 
 
 class TestStateManager(unittest.TestCase):
     """Tests for the StateManager class."""
     
+    # Nothing here depends on a real camera resolution; keep frames tiny
+    width = 8
+    height = 8
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests."""
+        cls._blank = np.zeros((cls.height, cls.width, 3), dtype=np.uint8)
+        cls._blank.flags.writeable = False
+        cls._blank_plus_one = cls._blank + 1
+        cls._blank_plus_one.flags.writeable = False
+        
+        # Mock states are built once; the spec rejects anything GameState doesn't define
+        cls._mock_menu_state = create_autospec(GameState, instance=True, spec_set=True)
+        cls._mock_playing_state = create_autospec(GameState, instance=True, spec_set=True)
+        
+        # One manager for the whole class; setUp puts it back in its initial state
+        cls._state_manager = StateManager(cls.width, cls.height)
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.width = 640
-        self.height = 480
-        self.state_manager = StateManager(self.width, self.height)
+        self.state_manager = self._state_manager
+        self.state_manager.current_state = None
+        self.state_manager.states.clear()
         
-        # Create mock states
-        self.mock_menu_state = MagicMock()
-        self.mock_playing_state = MagicMock()
+        # Reuse the mock states, forgetting calls and return values from earlier tests
+        self.mock_menu_state = self._mock_menu_state
+        self.mock_playing_state = self._mock_playing_state
+        for mock_state in (self.mock_menu_state, self.mock_playing_state):
+            mock_state.reset_mock(return_value=True, side_effect=True)
         
         # Add mock states to manager
         self.state_manager.states["menu"] = self.mock_menu_state
@@ -40,67 +66,43 @@ class TestStateManager(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.state_manager.change_state("non_existent")
     
-    def test_update(self):
-        """Test updating the current state."""
-        # Set current state
-        self.state_manager.current_state = self.mock_menu_state
-        
-        # Create mock hand landmarks and finger position
-        mock_landmarks = MagicMock()
-        mock_finger_pos = (100, 100)
-        
-        # Update state
-        self.state_manager.update(mock_landmarks, mock_finger_pos)
-        
-        # Check if update was called on the current state
-        self.mock_menu_state.update.assert_called_once_with(mock_landmarks, mock_finger_pos)
-    
-    def test_render(self):
-        """Test rendering the current state."""
-        # Set current state
-        self.state_manager.current_state = self.mock_playing_state
-        
-        # Create mock frame
-        mock_frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        
-        # Mock the render method to return a modified frame
-        self.mock_playing_state.render.return_value = mock_frame + 1
-        
-        # Render state
-        result_frame = self.state_manager.render(mock_frame)
-        
-        # Check if render was called on the current state
-        self.mock_playing_state.render.assert_called_once_with(mock_frame)
-        
-        # Check if the returned frame is the one from the state's render method
-        self.assertTrue(np.array_equal(result_frame, mock_frame + 1))
-    
-    def test_handle_key(self):
-        """Test handling key presses."""
-        # Set current state
-        self.state_manager.current_state = self.mock_menu_state
-        
-        # Mock the handle_key method to return True
-        self.mock_menu_state.handle_key.return_value = True
-        
-        # Handle key press
-        result = self.state_manager.handle_key(27)  # ESC key
-        
-        # Check if handle_key was called on the current state
-        self.mock_menu_state.handle_key.assert_called_once_with(27)
-        
-        # Check if the returned value is the one from the state's handle_key method
-        self.assertTrue(result)
+    def test_delegation(self):
+        """Test that update, render and handle_key are forwarded to the current state."""
+        cases = [
+            # (method, current state, arguments, value returned by the state)
+            ("update", self.mock_menu_state, (sentinel.landmarks, (100, 100)), True),
+            ("render", self.mock_playing_state, (self._blank,), self._blank_plus_one),
+            ("handle_key", self.mock_menu_state, (27,), True),  # ESC key
+        ]
+        for name, state, args, returned in cases:
+            with self.subTest(method=name):
+                self.state_manager.current_state = state
+                getattr(state, name).return_value = returned
+                
+                result = getattr(self.state_manager, name)(*args)
+                
+                # The call reaches the current state and its result comes back unchanged
+                getattr(state, name).assert_called_once_with(*args)
+                self.assertIs(result, returned)
 
 
 class TestMenuState(unittest.TestCase):
     """Tests for the MenuState class."""
     
+    width = 8
+    height = 8
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests."""
+        cls._blank = np.zeros((cls.height, cls.width, 3), dtype=np.uint8)
+        cls._blank.flags.writeable = False
+        cls._state_manager = create_autospec(StateManager, instance=True, spec_set=True)
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.width = 640
-        self.height = 480
-        self.state_manager = MagicMock()
+        self.state_manager = self._state_manager
+        self.state_manager.reset_mock(return_value=True, side_effect=True)
         self.menu_state = MenuState(self.state_manager, self.width, self.height)
     
     def test_initialization(self):
@@ -112,21 +114,12 @@ class TestMenuState(unittest.TestCase):
     
     def test_handle_key_navigation(self):
         """Test keyboard navigation in menu."""
-        # Test down arrow
-        self.menu_state.handle_key(ord('s'))
-        self.assertEqual(self.menu_state.selected_option, 1)
-        
-        # Test down arrow again
-        self.menu_state.handle_key(ord('s'))
-        self.assertEqual(self.menu_state.selected_option, 2)
-        
-        # Test wrapping around to the first option
-        self.menu_state.handle_key(ord('s'))
-        self.assertEqual(self.menu_state.selected_option, 0)
-        
-        # Test up arrow
-        self.menu_state.handle_key(ord('w'))
-        self.assertEqual(self.menu_state.selected_option, 2)
+        # Down, down, down again (wrapping around to the first option), then up
+        steps = [('s', 1), ('s', 2), ('s', 0), ('w', 2)]
+        for key, expected in steps:
+            with self.subTest(key=key, expected=expected):
+                self.menu_state.handle_key(ord(key))
+                self.assertEqual(self.menu_state.selected_option, expected)
     
     def test_handle_key_selection(self):
         """Test selecting options in menu."""
@@ -143,39 +136,65 @@ class TestMenuState(unittest.TestCase):
         result = self.menu_state.handle_key(13)  # Enter key
         self.assertFalse(result)  # Should return False to exit the game
     
+    def test_update_pointing_selects_option(self):
+        """Test that pointing at an option selects it."""
+        # Options are 60 px apart; "Settings" is the second one
+        settings_y = self.menu_state._option_start_y + self.menu_state._option_height
+        self.menu_state.update(None, (self.width // 2, settings_y + 5))
+        self.assertEqual(self.menu_state.selected_option, 1)
+        self.assertEqual(self.menu_state.selection_cooldown, 10)
+        
+        # Pointing between two options changes nothing
+        self.menu_state.selection_cooldown = 0
+        self.menu_state.update(None, (self.width // 2, settings_y + 35))
+        self.assertEqual(self.menu_state.selected_option, 1)
+    
     def test_render(self):
         """Test rendering the menu."""
-        # Create a frame to render on
-        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        
-        # Render the menu
-        result_frame = self.menu_state.render(frame.copy())  # Use a copy to ensure original isn't modified
+        # Render the menu onto a writable copy of the shared blank frame
+        result_frame = self.menu_state.render(self._blank.copy())
         
         # Basic check that rendering happened (frame should be modified)
-        self.assertFalse(np.all(result_frame == 0))  # Check that the result frame is not all zeros
+        self.assertTrue(result_frame.any())  # Check that the result frame is not all zeros
 
 
 class TestPlayingState(unittest.TestCase):
     """Tests for the PlayingState class."""
     
-    @patch('vision_snake.state_manager.SnakeGame')
-    def setUp(self, mock_snake_game_class):
+    width = 8
+    height = 8
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests."""
+        cls._blank = np.zeros((cls.height, cls.width, 3), dtype=np.uint8)
+        cls._blank.flags.writeable = False
+        cls._state_manager = create_autospec(StateManager, instance=True, spec_set=True)
+        
+        # Patch SnakeGame once for the whole class; every PlayingState gets the same mock game
+        cls._patcher = patch('vision_snake.state_manager.SnakeGame')
+        mock_snake_game_class = cls._patcher.start()
+        cls._mock_snake_game = create_autospec(SnakeGame, instance=True)
+        mock_snake_game_class.return_value = cls._mock_snake_game
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Restore the real SnakeGame."""
+        cls._patcher.stop()
+    
+    def setUp(self):
         """Set up test fixtures."""
-        self.width = 640
-        self.height = 480
-        self.state_manager = MagicMock()
+        self.state_manager = self._state_manager
+        self.state_manager.reset_mock(return_value=True, side_effect=True)
         
-        # Set up the mock SnakeGame
-        self.mock_snake_game = MagicMock()
-        mock_snake_game_class.return_value = self.mock_snake_game
+        # Reset the mock SnakeGame; game_over is an instance attribute, so the spec lacks it
+        self.mock_snake_game = self._mock_snake_game
+        self.mock_snake_game.reset_mock(return_value=True, side_effect=True)
+        self.mock_snake_game.game_over = False
         
         # Create the playing state after setting up the mock
         self.playing_state = PlayingState(self.state_manager, self.width, self.height)
     
-    def tearDown(self):
-        """Tear down test fixtures."""
-        # No need to stop any patchers as they're handled by the decorator
-    
     def test_initialization(self):
         """Test initialization of PlayingState."""
         self.assertEqual(self.playing_state.width, self.width)
@@ -194,18 +213,23 @@ class TestPlayingState(unittest.TestCase):
         # Check if update was called on the snake game
         self.mock_snake_game.update.assert_called_once_with(mock_finger_pos)
     
+    def test_update_game_over(self):
+        """Test that the game is not updated on the game over screen."""
+        self.mock_snake_game.game_over = True
+        
+        self.assertTrue(self.playing_state.update(None, (100, 100)))
+        self.mock_snake_game.update.assert_not_called()
+    
     def test_handle_key_pause(self):
         """Test pausing the game."""
         # Initially not paused
         self.assertFalse(self.playing_state.paused)
         
-        # Pause the game
-        self.playing_state.handle_key(ord('p'))
-        self.assertTrue(self.playing_state.paused)
-        
-        # Unpause the game
-        self.playing_state.handle_key(ord('p'))
-        self.assertFalse(self.playing_state.paused)
+        # Each press toggles: paused after an odd number of presses, running after an
+        # even number. Checking after every press keeps a no-op toggle from passing
+        for presses in range(1, 3):
+            self.playing_state.handle_key(ord('p'))
+            self.assertEqual(self.playing_state.paused, presses % 2 == 1)
     
     def test_handle_key_menu(self):
         """Test returning to menu."""
@@ -222,13 +246,34 @@ class TestPlayingState(unittest.TestCase):
         self.playing_state.handle_key(ord('r'))
         self.mock_snake_game.reset.assert_called_once()
     
+    def test_reset_gesture(self):
+        """Test that an open palm held long enough resets the game."""
+        # Wrist at the bottom, all five finger tips above it
+        hand_landmarks = np.full((21, 3), 0.5, dtype=np.float32)
+        hand_landmarks[0, 1] = 0.9
+        
+        # First sighting only starts the timer
+        self.playing_state._check_reset_gesture(hand_landmarks)
+        self.mock_snake_game.reset.assert_not_called()
+        self.assertIsNotNone(self.playing_state.palm_shown_start_time)
+        
+        # Holding the palm past the required duration resets the game
+        self.playing_state.palm_shown_start_time -= self.playing_state.palm_duration_required + 1
+        self.playing_state._check_reset_gesture(hand_landmarks)
+        self.mock_snake_game.reset.assert_called_once()
+        
+        # A closed hand (tips below the wrist) clears the timer
+        hand_landmarks[0, 1] = 0.1
+        self.playing_state._check_reset_gesture(hand_landmarks)
+        self.assertIsNone(self.playing_state.palm_shown_start_time)
+    
     def test_render(self):
         """Test rendering the game."""
         # Create a frame to render on
-        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        frame = self._blank
         
-        # Mock the draw method to return a modified frame
-        modified_frame = frame.copy() + 1
+        # Mock the draw method to return a modified frame (writable, the FPS is drawn on it)
+        modified_frame = self._blank + 1
         self.mock_snake_game.draw.return_value = modified_frame
         
         # Render the game